@@ -62,6 +62,14 @@ typedef struct {
  */
 EXPORT bool device_init(LogCallback log_callback);
 
+/**
+ * @brief Replace the logging callback
+ *
+ * @param log_callback Callback function for logging messages, or NULL to
+ * disable logging
+ */
+EXPORT void device_set_log_callback(LogCallback log_callback);
+
 /**
  * @brief Start the Semi-Vibe-Device simulator
  *
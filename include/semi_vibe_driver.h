@@ -71,6 +71,12 @@ typedef struct {
  */
 EXPORT bool driver_init(LogCallback log_callback);
 
+/**
+ * @brief Replace the logging callback
+ * @param log_callback Callback function for logging, or NULL to disable logging
+ */
+EXPORT void driver_set_log_callback(LogCallback log_callback);
+
 /**
  * @brief Connect to the device
  * @param host Hostname or IP address
@@ -92,6 +98,13 @@ EXPORT bool driver_disconnect();
  */
 EXPORT bool driver_get_status(DeviceStatus *status);
 
+/**
+ * @brief Get all actuator values
+ * @param actuators Pointer to actuator structure to fill
+ * @return true if successful, false otherwise
+ */
+EXPORT bool driver_get_actuators(ActuatorData *actuators);
+
 /**
  * @brief Get humidity value
  * @param value Pointer to store the humidity value (0-100)
@@ -57,11 +57,17 @@ class DeviceDLL:
 
         self.dll = ctypes.WinDLL(dll_path)
         self._callback = None  # Store the callback to prevent garbage collection
+        # Last replaced callback, kept alive because a log call already in
+        # flight on another DLL thread may still jump into it
+        self._previous_callback = None
 
         # Define function prototypes
         self.dll.device_init.argtypes = [LOGCALLBACK]
         self.dll.device_init.restype = c_bool
 
+        self.dll.device_set_log_callback.argtypes = [LOGCALLBACK]
+        self.dll.device_set_log_callback.restype = None
+
         self.dll.device_start.argtypes = []
         self.dll.device_start.restype = c_bool
 
@@ -89,6 +95,18 @@ class DeviceDLL:
         self._callback = LOGCALLBACK(log_callback)
         return self.dll.device_init(self._callback)
 
+    def set_log_callback(self, log_callback):
+        """Replace the logging callback.
+
+        Args:
+            log_callback: Callback function for logging, or None to stop the
+                DLL from logging
+        """
+        callback = None if log_callback is None else LOGCALLBACK(log_callback)
+        self.dll.device_set_log_callback(callback)
+        self._previous_callback = self._callback
+        self._callback = callback
+
     def start(self):
         """Start the device server.
 
@@ -77,11 +77,17 @@ class DriverDLL:
 
         self.dll = ctypes.WinDLL(dll_path)
         self._callback = None  # Store the callback to prevent garbage collection
+        # Last replaced callback, kept alive because a log call already in
+        # flight on another DLL thread may still jump into it
+        self._previous_callback = None
 
         # Define function prototypes
         self.dll.driver_init.argtypes = [LOGCALLBACK]
         self.dll.driver_init.restype = c_bool
 
+        self.dll.driver_set_log_callback.argtypes = [LOGCALLBACK]
+        self.dll.driver_set_log_callback.restype = None
+
         self.dll.driver_connect.argtypes = [c_char_p, c_int]
         self.dll.driver_connect.restype = c_bool
 
@@ -91,6 +97,9 @@ class DriverDLL:
         self.dll.driver_get_status.argtypes = [POINTER(DeviceStatus)]
         self.dll.driver_get_status.restype = c_bool
 
+        self.dll.driver_get_actuators.argtypes = [POINTER(ActuatorData)]
+        self.dll.driver_get_actuators.restype = c_bool
+
         self.dll.driver_get_humidity.argtypes = [POINTER(c_uint8)]
         self.dll.driver_get_humidity.restype = c_bool
 
@@ -148,6 +157,18 @@ class DriverDLL:
         self._callback = LOGCALLBACK(log_callback)
         return self.dll.driver_init(self._callback)
 
+    def set_log_callback(self, log_callback):
+        """Replace the logging callback.
+
+        Args:
+            log_callback: Callback function for logging, or None to stop the
+                DLL from logging
+        """
+        callback = None if log_callback is None else LOGCALLBACK(log_callback)
+        self.dll.driver_set_log_callback(callback)
+        self._previous_callback = self._callback
+        self._callback = callback
+
     def connect(self, host, port):
         """Connect to the device.
 
@@ -180,6 +201,17 @@ class DriverDLL:
         """
         return self.dll.driver_get_status(ctypes.byref(status))
 
+    def get_actuators(self, actuators):
+        """Get all actuator values.
+
+        Args:
+            actuators: ActuatorData structure to fill
+
+        Returns:
+            bool: True if successful
+        """
+        return self.dll.driver_get_actuators(ctypes.byref(actuators))
+
     def get_humidity(self):
         """Get humidity value.
 
@@ -6,8 +6,6 @@ Entry point for the unified testing system.
 
 import os
 import sys
-import time
-import socket
 import threading
 import queue
 import ctypes
@@ -18,40 +16,10 @@ sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "tests"
 import test_utils
 
 
-def is_server_ready(host="localhost", port=8989, max_attempts=10):
-    """Check if the server is ready to accept connections."""
-    print(f"Checking if server is ready on {host}:{port}...")
-
-    for attempt in range(max_attempts):
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.settimeout(1)
-                s.connect((host, port))
-                print(f"Server is ready after {attempt + 1} attempts!")
-                return True
-        except (ConnectionRefusedError, socket.timeout):
-            print(f"Server not ready yet (attempt {attempt + 1}/{max_attempts})...")
-            time.sleep(1)
-
-    print(f"Server did not become ready after {max_attempts} attempts")
-    return False
-
-
-def check_dll_exists(dll_path):
-    """Check if a DLL file exists and print an error if it doesn't."""
-    if not os.path.exists(dll_path):
-        print(f"ERROR: DLL file does not exist at {dll_path}")
-        return False
-    return True
-
-
 def load_device_dll(device_dll_path):
     """Load the device DLL with error handling."""
     print(f"Attempting to load device DLL from: {device_dll_path}")
 
-    if not check_dll_exists(device_dll_path):
-        return None
-
     try:
         # Import the device module
         sys.path.append(
@@ -77,9 +45,6 @@ def load_driver_dll(driver_dll_path):
     """Load the driver DLL with error handling."""
     print(f"Attempting to load driver DLL from: {driver_dll_path}")
 
-    if not check_dll_exists(driver_dll_path):
-        return None
-
     try:
         # Import the driver module
         sys.path.append(
@@ -189,31 +154,17 @@ def run_tests():
     print(f"Platform: {sys.platform}")
     print(f"Architecture: {sys.maxsize > 2**32 and '64-bit' or '32-bit'}")
     print(f"Current directory: {os.getcwd()}")
-    print(
-        f"DLL directory: {os.path.join(os.path.dirname(os.path.abspath(__file__)), 'build', 'bin', 'Debug')}"
-    )
+    print(f"DLL directory: {test_utils.DLL_DIR}")
 
     # Get the path to the DLLs
-    device_dll_path = os.path.join(
-        os.path.dirname(os.path.abspath(__file__)),
-        "build",
-        "bin",
-        "Debug",
-        "semi_vibe_device.dll",
-    )
-    driver_dll_path = os.path.join(
-        os.path.dirname(os.path.abspath(__file__)),
-        "build",
-        "bin",
-        "Debug",
-        "semi_vibe_driver.dll",
-    )
+    device_dll_path = test_utils.DEVICE_DLL_PATH
+    driver_dll_path = test_utils.DRIVER_DLL_PATH
 
     print(f"Device DLL exists: {os.path.exists(device_dll_path)}")
     print(f"Driver DLL exists: {os.path.exists(driver_dll_path)}")
 
     # Enable callback prints for setup
-    test_utils.enable_callback_prints()
+    test_utils.set_callback_prints(True)
 
     # Load the device DLL
     device = load_device_dll(device_dll_path)
@@ -232,7 +183,7 @@ def run_tests():
         return 1
 
     # Wait for the server to be ready
-    if not is_server_ready():
+    if not test_utils.is_server_ready():
         print("[FAIL] Server did not become ready")
         stop_device(device)
         return 1
@@ -283,7 +234,7 @@ def run_tests():
         from tests.test_runner import run_all_tests
 
         # Run all tests
-        test_result = run_all_tests(driver, device)
+        test_result = run_all_tests(driver, device, stop_on_fail=test_utils.FAIL_FAST)
 
         return 0 if test_result else 1
     except Exception as e:
@@ -299,9 +250,14 @@ def run_tests():
 
 def main():
     """Main function."""
-    if len(sys.argv) > 1 and sys.argv[1] != "test":
-        print(f"Unknown command: {sys.argv[1]}")
-        print("Usage: python run.py [test]")
+    args = sys.argv[1:]
+    if "--brute" in args:
+        args.remove("--brute")
+        test_utils.BRUTE_FORCE = True
+
+    if args and args[0] != "test":
+        print(f"Unknown command: {args[0]}")
+        print("Usage: python run.py [test] [--brute]")
         return 1
 
     return run_tests()
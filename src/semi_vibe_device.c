@@ -68,6 +68,8 @@ EXPORT bool device_init(LogCallback log_callback) {
   return true;
 }
 
+EXPORT void device_set_log_callback(LogCallback log_callback) { g_log_callback = log_callback; }
+
 EXPORT bool device_start() {
   if (g_running) {
     log_message("Device is already running");
@@ -214,6 +216,12 @@ static THREAD_RETURN_TYPE handle_client(void *arg) {
 
     log_message("Client connected: %s", inet_ntoa(client_addr.sin_addr));
 
+    // Disable Nagle so each 6 digit response goes out immediately
+    int no_delay = 1;
+    if (setsockopt(g_client_socket, IPPROTO_TCP, TCP_NODELAY, (const char *)&no_delay, sizeof(no_delay)) < 0) {
+      log_message("Failed to set TCP_NODELAY");
+    }
+
     // Send ACK message
     const char *ack_message = "ACK";
     send(g_client_socket, ack_message, (int)strlen(ack_message), 0);
@@ -535,13 +543,15 @@ static bool process_command(const char *command, char *response) {
 }
 
 static void log_message(const char *format, ...) {
-  if (g_log_callback) {
+  // Read the callback once so device_set_log_callback cannot swap it out between the check and the call
+  LogCallback log_callback = g_log_callback;
+  if (log_callback) {
     char buffer[BUFFER_SIZE];
     va_list args;
     va_start(args, format);
     vsnprintf(buffer, BUFFER_SIZE, format, args);
     va_end(args);
 
-    g_log_callback(buffer);
+    log_callback(buffer);
   }
 }
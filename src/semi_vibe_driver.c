@@ -112,6 +112,13 @@ EXPORT bool driver_init(LogCallback log_callback) {
   return true;
 }
 
+/**
+ * @brief Replace the logging callback
+ *
+ * @param log_callback Callback for logging, or NULL to disable logging
+ */
+EXPORT void driver_set_log_callback(LogCallback log_callback) { g_driver.log_callback = log_callback; }
+
 /**
  * @brief Connect to the device
  *
@@ -169,6 +176,12 @@ EXPORT bool driver_connect(const char *host, int port) {
     return false;
   }
 
+  // Disable Nagle so each 6 digit command goes out immediately
+  int no_delay = 1;
+  if (setsockopt(g_driver.socket, IPPROTO_TCP, TCP_NODELAY, (const char *)&no_delay, sizeof(no_delay)) < 0) {
+    log_message("Failed to set TCP_NODELAY");
+  }
+
   // Wait for ACK message
   char buffer[BUFFER_SIZE];
   memset(buffer, 0, BUFFER_SIZE);
@@ -247,6 +260,33 @@ EXPORT bool driver_get_status(DeviceStatus *status) {
   return true;
 }
 
+/**
+ * @brief Get all actuator values
+ *
+ * @param actuators Pointer to ActuatorData structure to be filled
+ * @return true if all values were retrieved successfully
+ */
+EXPORT bool driver_get_actuators(ActuatorData *actuators) {
+  if (!g_driver.connected || !actuators) {
+    return false;
+  }
+
+  uint8_t heater_value = 0;
+
+  // Read actuator registers
+  if (!read_register(BASE_ACTUATOR, OFFSET_LED, &actuators->led_value) ||
+      !read_register(BASE_ACTUATOR, OFFSET_FAN, &actuators->fan_value) ||
+      !read_register(BASE_ACTUATOR, OFFSET_HEATER, &heater_value) ||
+      !read_register(BASE_ACTUATOR, OFFSET_DOORS, &actuators->doors_value)) {
+    return false;
+  }
+
+  // Heater only uses lower 4 bits
+  actuators->heater_value = heater_value & MASK_HEATER_VALUE;
+
+  return true;
+}
+
 /**
  * @brief Get humidity value
  *
@@ -721,14 +761,16 @@ EXPORT bool driver_send_command(const char *command, char *response) {
  * @param ... Format arguments
  */
 static void log_message(const char *format, ...) {
-  if (g_driver.log_callback) {
+  // Read the callback once so driver_set_log_callback cannot swap it out between the check and the call
+  LogCallback log_callback = g_driver.log_callback;
+  if (log_callback) {
     char buffer[BUFFER_SIZE];
     va_list args;
     va_start(args, format);
     vsnprintf(buffer, BUFFER_SIZE, format, args);
     va_end(args);
 
-    g_driver.log_callback(buffer);
+    log_callback(buffer);
   }
 }
 
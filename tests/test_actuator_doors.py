@@ -4,15 +4,21 @@ Test cases for doors actuator functionality.
 """
 
 import sys
-import os
-import ctypes
 
-# Add the python directory to the path
-sys.path.append(
-    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "python")
-)
-from driver import DOOR_1, DOOR_2, DOOR_3, DOOR_4, DOOR_OPEN, DOOR_CLOSED
 import test_utils
+from driver import DOOR_1, DOOR_2, DOOR_3, DOOR_4, DOOR_OPEN, DOOR_CLOSED
+
+# Door states for all 16 possible configurations (2^4 = 16), indexed by
+# configuration number with bit N giving the state of door N+1
+DOOR_CONFIGS = tuple(
+    {
+        DOOR_1: DOOR_OPEN if (config_num & 1) else DOOR_CLOSED,
+        DOOR_2: DOOR_OPEN if (config_num & 2) else DOOR_CLOSED,
+        DOOR_3: DOOR_OPEN if (config_num & 4) else DOOR_CLOSED,
+        DOOR_4: DOOR_OPEN if (config_num & 8) else DOOR_CLOSED,
+    }
+    for config_num in range(16)
+)
 
 
 def test_doors_api(driver):
@@ -38,16 +44,7 @@ def test_doors_api(driver):
     test_utils.print_func(f"Testing all 16 possible door configurations...")
     all_passed = True
 
-    # Generate all 16 possible configurations (2^4 = 16)
-    for config_num in range(16):
-        # Convert configuration number to door states
-        door_states = {
-            DOOR_1: DOOR_OPEN if (config_num & 1) else DOOR_CLOSED,
-            DOOR_2: DOOR_OPEN if (config_num & 2) else DOOR_CLOSED,
-            DOOR_3: DOOR_OPEN if (config_num & 4) else DOOR_CLOSED,
-            DOOR_4: DOOR_OPEN if (config_num & 8) else DOOR_CLOSED,
-        }
-
+    for config_num, door_states in enumerate(DOOR_CONFIGS):
         # Print the configuration
         config_desc = ", ".join(
             [
@@ -132,20 +129,10 @@ def run_tests(driver):
     # When running as part of the test suite, disable print
     test_utils.set_print_disabled()
 
-    results = []
-
-    # Run doors test with the new API
-    results.append(("Doors Control", test_doors_api(driver)))
-
-    # Print summary
-    test_utils.print_func("\n=== Doors Tests Summary ===")
-    all_passed = True
-    for name, result in results:
-        status = "[PASSED] PASSED" if result else "[FAIL] FAILED"
-        test_utils.print_func(f"{name}: {status}")
-        all_passed = all_passed and result
-
-    return all_passed
+    return test_utils.run_test_cases(
+        "Doors Tests",
+        (("Doors Control", lambda: test_doors_api(driver)),),
+    )
 
 
 def main():
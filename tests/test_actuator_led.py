@@ -4,38 +4,41 @@ Test cases for LED actuator functionality.
 """
 
 import sys
-import os
 
-# Add the python directory to the path
-sys.path.append(
-    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "python")
-)
-from driver import ActuatorData
 import test_utils
 
+# Every value of the 8-bit LED register
+LED_RANGE = range(256)
+
 
 def test_led_range(driver):
-    """Test LED control across the full range (0-255)."""
-    test_utils.print_func("\n=== Testing LED Range (Brute Force) ===")
+    """Test LED control across the range (0-255)."""
+    print_func = test_utils.print_func
+    print_func("\n=== Testing LED Range ===")
 
     # Get initial LED value
     initial_value = driver.get_led()
     if initial_value is None:
-        test_utils.print_func("[FAIL] Failed to get initial LED value")
+        print_func("[FAIL] Failed to get initial LED value")
         return False
 
-    test_utils.print_func(f"Initial LED value: {initial_value}")
+    print_func(f"Initial LED value: {initial_value}")
 
-    # Test every value in the range 0-255
+    # Test every value in brute force mode, otherwise a covering subset
+    test_values = LED_RANGE if test_utils.BRUTE_FORCE else test_utils.COVERAGE_VALUES
     all_passed = True
     failed_values = []
+    # Last value read back from the device, None when unknown
+    final_device_value = None
 
-    test_utils.print_func("Testing all LED values from 0 to 255...")
-    for test_value in range(256):
+    print_func(f"Testing {len(test_values)} LED values...")
+    for tested, test_value in enumerate(test_values, 1):
         # Set LED to test value
-        test_utils.print_func(f"Setting LED value to {test_value}...")
+        if test_utils.VERBOSE:
+            print_func(f"Setting LED value to {test_value}...")
         if not driver.set_led(test_value):
-            test_utils.print_func(f"[FAIL] Failed to set LED value to {test_value}")
+            print_func(f"[FAIL] Failed to set LED value to {test_value}")
+            final_device_value = None
             all_passed = False
             failed_values.append(test_value)
             continue
@@ -43,14 +46,17 @@ def test_led_range(driver):
         # Verify the value
         read_value = driver.get_led()
         if read_value is None:
-            test_utils.print_func("[FAIL] Failed to get updated LED value")
+            print_func("[FAIL] Failed to get updated LED value")
+            final_device_value = None
             all_passed = False
             failed_values.append(test_value)
             continue
+        final_device_value = read_value
 
-        test_utils.print_func(f"Read back LED value: {read_value}")
+        if test_utils.VERBOSE:
+            print_func(f"Read back LED value: {read_value}")
         if read_value != test_value:
-            test_utils.print_func(
+            print_func(
                 f"[FAIL] LED value mismatch: expected {test_value}, got {read_value}"
             )
             all_passed = False
@@ -58,36 +64,38 @@ def test_led_range(driver):
             continue
 
         # Print progress every 25 values
-        if test_value % 25 == 0 or test_value == 255:
-            test_utils.print_func(f"[PASSED] Tested LED values 0-{test_value}")
-
-    # Reset LED to initial value
-    test_utils.print_func(f"Resetting LED to initial value {initial_value}...")
-    if not driver.set_led(initial_value):
-        test_utils.print_func("[FAIL] Failed to reset LED value")
-        return False
-
-    # Verify the reset value
-    final_value = driver.get_led()
-    if final_value is None:
-        test_utils.print_func("[FAIL] Failed to get LED value after reset")
-        return False
-
-    test_utils.print_func(f"Final LED value after reset: {final_value}")
+        if test_utils.VERBOSE and (tested % 25 == 0 or tested == len(test_values)):
+            print_func(f"[PASSED] Tested {tested} of {len(test_values)} LED values")
+
+    # Reset LED to initial value unless the sweep already left it there
+    if final_device_value != initial_value:
+        print_func(f"Resetting LED to initial value {initial_value}...")
+        if not driver.set_led(initial_value):
+            print_func("[FAIL] Failed to reset LED value")
+            return False
+
+    # Read back the reset value for standalone output only; the set call
+    # above already reports failure
+    if test_utils.VERBOSE:
+        final_value = driver.get_led()
+        if final_value is None:
+            print_func("[FAIL] Failed to get LED value after reset")
+            return False
+
+        print_func(f"Final LED value after reset: {final_value}")
 
     if all_passed:
-        test_utils.print_func("[PASSED] LED range test passed for all 256 values")
+        print_func(f"[PASSED] LED range test passed for all {len(test_values)} values")
     else:
-        test_utils.print_func(
-            f"[FAIL] LED range test failed for values: {failed_values}"
-        )
+        print_func(f"[FAIL] LED range test failed for values: {failed_values}")
 
     return all_passed
 
 
-def test_led_get_api(driver):
-    """Test the get_led API function."""
-    test_utils.print_func("\n=== Testing LED Get API ===")
+def test_led_get_api(driver, fail_fast=False):
+    """Test the get_led API function, stopping at the first failure if fail_fast."""
+    print_func = test_utils.print_func
+    print_func("\n=== Testing LED Get API ===")
 
     # Test a smaller set of values to keep the test manageable
     test_values = [0, 25, 50, 75, 100, 125, 150, 175, 200, 225, 255]
@@ -97,71 +105,78 @@ def test_led_get_api(driver):
     # Get initial LED value
     initial_value = driver.get_led()
     if initial_value is None:
-        test_utils.print_func("[FAIL] Failed to get initial LED value")
+        print_func("[FAIL] Failed to get initial LED value")
         return False
 
-    test_utils.print_func(f"Initial LED value: {initial_value}")
-    test_utils.print_func(f"Testing {len(test_values)} LED values...")
+    print_func(f"Initial LED value: {initial_value}")
+    print_func(f"Testing {len(test_values)} LED values...")
 
     for test_value in test_values:
-        test_utils.print_func(f"\nSetting LED value to {test_value}...")
+        if test_utils.VERBOSE:
+            print_func(f"\nSetting LED value to {test_value}...")
 
         # Set LED to test value
         if not driver.set_led(test_value):
-            test_utils.print_func(f"[FAIL] Failed to set LED value to {test_value}")
+            print_func(f"[FAIL] Failed to set LED value to {test_value}")
             all_passed = False
             failed_values.append(test_value)
+            if fail_fast:
+                break
             continue
 
         # Verify the value using the get_led API
         read_value = driver.get_led()
         if read_value is None:
-            test_utils.print_func("[FAIL] Failed to read LED value")
+            print_func("[FAIL] Failed to read LED value")
             all_passed = False
             failed_values.append(test_value)
+            if fail_fast:
+                break
             continue
 
-        test_utils.print_func(f"Read LED value: {read_value}")
+        if test_utils.VERBOSE:
+            print_func(f"Read LED value: {read_value}")
 
         # Check if the read value matches what we set
         if read_value != test_value:
-            test_utils.print_func(
+            print_func(
                 f"[FAIL] Value mismatch: expected {test_value}, got {read_value}"
             )
             all_passed = False
             failed_values.append(test_value)
+            if fail_fast:
+                break
             continue
 
-        test_utils.print_func(f"[PASSED] Verified LED value {test_value}")
+        if test_utils.VERBOSE:
+            print_func(f"[PASSED] Verified LED value {test_value}")
 
     # Reset LED to initial value
-    test_utils.print_func(f"\nResetting LED to initial value {initial_value}...")
+    print_func(f"\nResetting LED to initial value {initial_value}...")
     if not driver.set_led(initial_value):
-        test_utils.print_func("[FAIL] Failed to reset LED value")
+        print_func("[FAIL] Failed to reset LED value")
         return False
 
     # Verify reset value
     final_value = driver.get_led()
     if final_value is None:
-        test_utils.print_func("[FAIL] Failed to get final LED value")
+        print_func("[FAIL] Failed to get final LED value")
         return False
 
-    test_utils.print_func(f"Final LED value after reset: {final_value}")
+    print_func(f"Final LED value after reset: {final_value}")
 
     if final_value != initial_value:
-        test_utils.print_func(
+        print_func(
             f"[FAIL] Failed to reset LED value: expected {initial_value}, got {final_value}"
         )
         all_passed = False
 
     if all_passed:
-        test_utils.print_func(
+        print_func(
             f"[PASSED] LED get API test passed for all {len(test_values)} values"
         )
     else:
-        test_utils.print_func(
-            f"[FAIL] LED get API test failed for values: {failed_values}"
-        )
+        print_func(f"[FAIL] LED get API test failed for values: {failed_values}")
 
     return all_passed
 
@@ -171,23 +186,13 @@ def run_tests(driver, device=None):
     # When running as part of the test suite, disable print
     test_utils.set_print_disabled()
 
-    results = []
-
-    # Run LED range test
-    results.append(("LED Range Control", test_led_range(driver)))
-
-    # Run LED get API test
-    results.append(("LED Get API", test_led_get_api(driver)))
-
-    # Print summary
-    test_utils.print_func("\n=== LED Tests Summary ===")
-    all_passed = True
-    for name, result in results:
-        status = "[PASSED] PASSED" if result else "[FAIL] FAILED"
-        test_utils.print_func(f"{name}: {status}")
-        all_passed = all_passed and result
-
-    return all_passed
+    return test_utils.run_test_cases(
+        "LED Tests",
+        (
+            ("LED Range Control", lambda: test_led_range(driver)),
+            ("LED Get API", lambda: test_led_get_api(driver, fail_fast=True)),
+        ),
+    )
 
 
 def main():
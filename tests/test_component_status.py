@@ -4,12 +4,8 @@ Test cases for component status functionality (power state and error state).
 """
 
 import sys
-import os
 
-# Add the python directory to the path
-sys.path.append(
-    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "python")
-)
+import test_utils
 from driver import (
     COMPONENT_TEMPERATURE,
     COMPONENT_HUMIDITY,
@@ -18,34 +14,62 @@ from driver import (
     COMPONENT_HEATER,
     COMPONENT_DOORS,
 )
-from device import DeviceMemory
-import test_utils
 
+# Every component as (display name, component type)
+COMPONENTS = (
+    ("Temperature", COMPONENT_TEMPERATURE),
+    ("Humidity", COMPONENT_HUMIDITY),
+    ("LED", COMPONENT_LED),
+    ("Fan", COMPONENT_FAN),
+    ("Heater", COMPONENT_HEATER),
+    ("Doors", COMPONENT_DOORS),
+)
 
-def test_power_state(driver, device):
-    """Test getting power state for all components."""
-    test_utils.print_func("\n=== Testing Power State ===")
 
-    # Get current device memory to check initial state
-    device_memory = DeviceMemory()
-    if not device.get_memory(device_memory):
-        test_utils.print_func("[FAIL] Failed to get device memory")
+def _set_and_verify_power(driver, name, component_type, powered):
+    """Set the power state of a component and read it back.
+
+    Args:
+        driver: DriverDLL instance
+        name: Component name used in messages
+        component_type: Component type (COMPONENT_TEMPERATURE, COMPONENT_HUMIDITY, etc.)
+        powered: True to power the component on, False to power it off
+
+    Returns:
+        bool: True if the component reports the requested state
+    """
+    state_name = "ON" if powered else "OFF"
+    test_utils.print_func(f"Turning {name} {state_name}...")
+    if not driver.set_power_state(component_type, powered):
+        test_utils.print_func(f"[FAIL] Failed to turn {name} {state_name}")
+        return False
+
+    # Verify the new state
+    power_state = driver.get_power_state(component_type)
+    if power_state is None:
+        test_utils.print_func(
+            f"[FAIL] Failed to get power state for {name} after turning {state_name}"
+        )
         return False
 
-    # Test all components
-    components = [
-        ("Temperature", COMPONENT_TEMPERATURE),
-        ("Humidity", COMPONENT_HUMIDITY),
-        ("LED", COMPONENT_LED),
-        ("Fan", COMPONENT_FAN),
-        ("Heater", COMPONENT_HEATER),
-        ("Doors", COMPONENT_DOORS),
-    ]
+    if power_state != powered:
+        test_utils.print_func(
+            f"[FAIL] {name} is still {'ON' if power_state else 'OFF'} after turning {state_name}"
+        )
+        return False
+
+    test_utils.print_func(f"[PASSED] {name} is now {state_name}")
+    return True
+
+
+def test_power_state(driver, device):
+    """Test getting power state for all components."""
+    test_utils.print_func("\n=== Testing Power State ===")
 
     all_passed = True
 
     # Test getting power state for each component
-    for name, component_type in components:
+    for name, component_type in COMPONENTS:
         power_state = driver.get_power_state(component_type)
         if power_state is None:
             test_utils.print_func(f"[FAIL] Failed to get power state for {name}")
@@ -58,7 +82,7 @@ def test_power_state(driver, device):
     test_utils.print_func("\n=== Testing Set Power State ===")
 
     # Test each component individually
-    for name, component_type in components:
+    for name, component_type in COMPONENTS:
         # Get initial state
         initial_state = driver.get_power_state(component_type)
         if initial_state is None:
@@ -68,54 +92,16 @@ def test_power_state(driver, device):
             all_passed = False
             continue
 
-        # Turn off
-        test_utils.print_func(f"Turning {name} OFF...")
-        if not driver.set_power_state(component_type, False):
-            test_utils.print_func(f"[FAIL] Failed to turn {name} OFF")
-            all_passed = False
-            continue
-
-        # Verify it's off
-        power_state = driver.get_power_state(component_type)
-        if power_state is None:
-            test_utils.print_func(
-                f"[FAIL] Failed to get power state for {name} after turning OFF"
-            )
-            all_passed = False
-            continue
-
-        if power_state:
-            test_utils.print_func(f"[FAIL] {name} is still ON after turning OFF")
-            all_passed = False
-            continue
-
-        test_utils.print_func(f"[PASSED] {name} is now OFF")
-
-        # Turn on
-        test_utils.print_func(f"Turning {name} ON...")
-        if not driver.set_power_state(component_type, True):
-            test_utils.print_func(f"[FAIL] Failed to turn {name} ON")
-            all_passed = False
-            continue
-
-        # Verify it's on
-        power_state = driver.get_power_state(component_type)
-        if power_state is None:
-            test_utils.print_func(
-                f"[FAIL] Failed to get power state for {name} after turning ON"
-            )
-            all_passed = False
-            continue
-
-        if not power_state:
-            test_utils.print_func(f"[FAIL] {name} is still OFF after turning ON")
+        # Turn off, then back on
+        if not (
+            _set_and_verify_power(driver, name, component_type, False)
+            and _set_and_verify_power(driver, name, component_type, True)
+        ):
             all_passed = False
             continue
 
-        test_utils.print_func(f"[PASSED] {name} is now ON")
-
-        # Restore initial state
-        if initial_state != power_state:
+        # Restore initial state (the component is ON at this point)
+        if not initial_state:
             test_utils.print_func(
                 f"Restoring {name} to initial state ({initial_state})..."
             )
@@ -258,26 +244,10 @@ def test_error_state(driver, device):
     """Test getting error state for all components."""
     test_utils.print_func("\n=== Testing Error State ===")
 
-    # Get current device memory to check initial state
-    device_memory = DeviceMemory()
-    if not device.get_memory(device_memory):
-        test_utils.print_func("[FAIL] Failed to get device memory")
-        return False
-
-    # Test all components
-    components = [
-        ("Temperature", COMPONENT_TEMPERATURE),
-        ("Humidity", COMPONENT_HUMIDITY),
-        ("LED", COMPONENT_LED),
-        ("Fan", COMPONENT_FAN),
-        ("Heater", COMPONENT_HEATER),
-        ("Doors", COMPONENT_DOORS),
-    ]
-
     all_passed = True
 
     # Test getting error state for each component
-    for name, component_type in components:
+    for name, component_type in COMPONENTS:
         error_state = driver.get_error_state(component_type)
         if error_state is None:
             test_utils.print_func(f"[FAIL] Failed to get error state for {name}")
@@ -301,20 +271,10 @@ def test_reset_component(driver, device):
     """Test resetting individual components."""
     test_utils.print_func("\n=== Testing Reset Component ===")
 
-    # Test all components
-    components = [
-        ("Temperature", COMPONENT_TEMPERATURE),
-        ("Humidity", COMPONENT_HUMIDITY),
-        ("LED", COMPONENT_LED),
-        ("Fan", COMPONENT_FAN),
-        ("Heater", COMPONENT_HEATER),
-        ("Doors", COMPONENT_DOORS),
-    ]
-
     all_passed = True
 
     # Test resetting each component individually
-    for name, component_type in components:
+    for name, component_type in COMPONENTS:
         test_utils.print_func(f"Resetting {name}...")
         if not driver.reset_component(component_type):
             test_utils.print_func(f"[FAIL] Failed to reset {name}")
@@ -360,26 +320,14 @@ def run_tests(driver, device):
     # When running as part of the test suite, disable print
     test_utils.set_print_disabled()
 
-    results = []
-
-    # Run power state test
-    results.append(("Power State", test_power_state(driver, device)))
-
-    # Run error state test
-    results.append(("Error State", test_error_state(driver, device)))
-
-    # Run reset component test
-    results.append(("Reset Component", test_reset_component(driver, device)))
-
-    # Print summary
-    test_utils.print_func("\n=== Component Status Tests Summary ===")
-    all_passed = True
-    for name, result in results:
-        status = "[PASSED] PASSED" if result else "[FAIL] FAILED"
-        test_utils.print_func(f"{name}: {status}")
-        all_passed = all_passed and result
-
-    return all_passed
+    return test_utils.run_test_cases(
+        "Component Status Tests",
+        (
+            ("Power State", lambda: test_power_state(driver, device)),
+            ("Error State", lambda: test_error_state(driver, device)),
+            ("Reset Component", lambda: test_reset_component(driver, device)),
+        ),
+    )
 
 
 def main():
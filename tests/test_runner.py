@@ -13,6 +13,13 @@ import traceback
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 import test_utils
 
+# Python files in the tests directory that are not test modules
+EXCLUDED_FILES = frozenset(
+    {"test_runner.py", "test_utils.py", "test_template.py", "__init__.py"}
+)
+# Print full tracebacks of module errors in the summary (SEMIVIBE_VERBOSE=1)
+SHOW_TRACEBACKS = os.environ.get("SEMIVIBE_VERBOSE", "") not in ("", "0")
+
 
 def discover_test_modules():
     """Discover all test modules in the tests directory."""
@@ -24,10 +31,7 @@ def discover_test_modules():
         if (
             filename.startswith("test_")
             and filename.endswith(".py")
-            and filename != "test_runner.py"
-            and filename != "test_utils.py"
-            and filename != "test_template.py"
-            and filename != "__init__.py"
+            and filename not in EXCLUDED_FILES
         ):
             module_name = filename[:-3]  # Remove .py extension
             test_modules.append(module_name)
@@ -37,12 +41,41 @@ def discover_test_modules():
     return test_modules
 
 
-def run_all_tests(driver, device=None):
+def load_test_modules(module_names):
+    """Import all test modules once and build the dispatch table.
+
+    Args:
+        module_names: Module names returned by discover_test_modules
+
+    Returns:
+        list: (module_name, run_tests, argc) tuples in run order. run_tests is
+            the module's run_tests function, None if it has none, or the
+            exception raised while importing the module or inspecting
+            run_tests; argc is the number of arguments run_tests takes
+    """
+    dispatch = []
+    for module_name in module_names:
+        try:
+            module = importlib.import_module(f"tests.{module_name}")
+
+            run_tests = getattr(module, "run_tests", None)
+            if inspect.isfunction(run_tests):
+                argc = len(inspect.signature(run_tests).parameters)
+                dispatch.append((module_name, run_tests, argc))
+            else:
+                dispatch.append((module_name, None, 0))
+        except Exception as e:
+            dispatch.append((module_name, e, 0))
+    return dispatch
+
+
+def run_all_tests(driver, device=None, stop_on_fail=False):
     """Run all discovered tests.
 
     Args:
         driver: DriverDLL instance
         device: DeviceDLL instance (optional)
+        stop_on_fail: Skip the remaining modules after the first failure
 
     Returns:
         bool: True if all tests passed, False otherwise
@@ -51,44 +84,62 @@ def run_all_tests(driver, device=None):
     test_utils.set_print_disabled()
 
     # Disable callback prints for cleaner output
-    test_utils.disable_callback_prints()
+    test_utils.set_callback_prints(False)
+
+    # Nothing prints the log lines now, so stop the DLLs calling back into
+    # Python for every one of them
+    driver.set_log_callback(None)
+    if device is not None:
+        device.set_log_callback(None)
 
-    test_modules = discover_test_modules()
+    test_modules = load_test_modules(discover_test_modules())
     print(f"\n=== Found {len(test_modules)} test modules ===")
 
     results = []
+    errors = []
 
-    for module_name in test_modules:
+    for module_name, run_tests, argc in test_modules:
         try:
-            # Import the module
-            module = importlib.import_module(f"tests.{module_name}")
+            # Report a failed import or inspection as an error in that module only
+            if isinstance(run_tests, Exception):
+                raise run_tests
 
             # Check if the module has a run_tests function
-            if hasattr(module, "run_tests") and inspect.isfunction(module.run_tests):
+            if run_tests is not None:
                 print(f"\n=== Running {module_name} ===")
 
                 # Pass both driver and device if the function accepts both
-                sig = inspect.signature(module.run_tests)
-                if len(sig.parameters) > 1 and device is not None:
-                    result = module.run_tests(driver, device)
+                if argc > 1 and device is not None:
+                    result = run_tests(driver, device)
                 else:
-                    result = module.run_tests(driver)
+                    result = run_tests(driver)
 
                 results.append((module_name, result))
             else:
                 print(f"⚠️ {module_name} has no run_tests function")
         except Exception as e:
             print(f"[ERROR] Error in {module_name}: {str(e)}")
-            traceback.print_exc()
+            errors.append((module_name, e))
             results.append((module_name, False))
 
+        if stop_on_fail and results and not results[-1][1]:
+            print(f"\nStopping after failure in {module_name}")
+            break
+
     # Print summary
     print("\n=== TEST SUMMARY ===")
-    all_passed = True
     for module_name, result in results:
         status = "[PASS]" if result else "[FAIL]"
         print(f"{status} - {module_name}")
-        all_passed = all_passed and result
+
+    if errors and SHOW_TRACEBACKS:
+        for module_name, error in errors:
+            print(f"\n=== Traceback for {module_name} ===")
+            traceback.print_exception(type(error), error, error.__traceback__)
+    elif errors:
+        print("\nSet SEMIVIBE_VERBOSE=1 to show tracebacks for module errors")
+
+    all_passed = all(result for _, result in results)
 
     overall_status = "[ALL TESTS PASSED]" if all_passed else "[SOME TESTS FAILED]"
     print(f"\n{overall_status}\n")
@@ -4,47 +4,39 @@ Test cases for humidity sensor functionality.
 """
 
 import sys
-import os
 import ctypes
-import time
 
-# Add the python directory to the path
-sys.path.append(
-    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "python")
-)
-from driver import SensorData
-from device import DeviceMemory
 import test_utils
+from device import DeviceMemory
+
+# Valid responses to the humidity read command (2210XX where XX is the
+# humidity value in hex) mapped to the value they carry
+HUMIDITY_RESPONSES = {f"2210{value:02X}".encode(): value for value in range(256)}
+# Response buffer reused by every direct read; every successful
+# send_command overwrites it with a full 6 digit, NUL terminated response
+RESPONSE_BUFFER = ctypes.create_string_buffer(7)
 
 
 def get_humidity_value_direct(driver):
     """Get humidity value using direct command interface."""
-    response_buffer = ctypes.create_string_buffer(7)
+    response_buffer = RESPONSE_BUFFER
     if not driver.send_command("221000", response_buffer):
         test_utils.print_func(
             "[FAIL] Failed to send direct command to get humidity value"
         )
         return None
 
-    # Parse the response (format: 2210XX where XX is the humidity value in hex)
-    response = response_buffer.value.decode("utf-8")
-    if len(response) != 6 or not response.startswith("2210"):
+    # Look up the value carried by the response
+    humidity_value = HUMIDITY_RESPONSES.get(response_buffer.value)
+    if humidity_value is None:
+        response = response_buffer.value.decode("utf-8", "replace")
         test_utils.print_func(f"[FAIL] Invalid response format: {response}")
-        return None
-
-    try:
-        humidity_value = int(response[4:], 16)
-        return humidity_value
-    except ValueError:
-        test_utils.print_func(
-            f"[FAIL] Failed to parse humidity value from response: {response}"
-        )
-        return None
+    return humidity_value
 
 
-def test_humidity_sensor_direct(driver, device):
-    """Test humidity sensor using direct memory access and direct commands."""
-    test_utils.print_func("\n=== Testing Humidity Sensor (Direct Commands) ===")
+def test_humidity_sensor(driver, device):
+    """Test humidity readback through both direct commands and the get_humidity API."""
+    test_utils.print_func("\n=== Testing Humidity Sensor (Direct Commands and API) ===")
 
     # Get initial humidity value using direct command
     initial_value = get_humidity_value_direct(driver)
@@ -57,180 +49,99 @@ def test_humidity_sensor_direct(driver, device):
     # Test a smaller set of values to keep the test manageable
     test_values = [0, 25, 50, 75, 100, 125, 150, 175, 200, 225, 255]
     all_passed = True
-    failed_values = []
+    direct_failed_values = []
+    api_failed_values = []
+
+    # Both read paths are checked after every single memory write
+    readers = (
+        (
+            "direct command",
+            lambda: get_humidity_value_direct(driver),
+            direct_failed_values,
+        ),
+        ("get_humidity API", driver.get_humidity, api_failed_values),
+    )
 
     test_utils.print_func(f"Testing {len(test_values)} humidity values...")
-    for test_value in test_values:
-        test_utils.print_func(f"\nSetting humidity value to {test_value}...")
 
-        # Get current device memory
-        device_memory = DeviceMemory()
-        if not device.get_memory(device_memory):
-            test_utils.print_func("[FAIL] Failed to get device memory")
-            all_passed = False
-            failed_values.append(test_value)
-            continue
-
-        # Update memory with new humidity value
-        device_memory.sensor_b_reading = test_value
-        if not device.set_memory(device_memory):
-            test_utils.print_func("[FAIL] Failed to set device memory")
-            all_passed = False
-            failed_values.append(test_value)
-            continue
-
-        # Small delay to ensure memory update is processed
-        time.sleep(0.1)
-
-        # Verify the value using direct command
-        read_value = get_humidity_value_direct(driver)
-        if read_value is None:
-            test_utils.print_func("[FAIL] Failed to read humidity value")
-            all_passed = False
-            failed_values.append(test_value)
-            continue
-
-        test_utils.print_func(f"Read humidity value: {read_value}")
-
-        # Check if the read value matches what we set
-        if read_value != test_value:
-            test_utils.print_func(
-                f"[FAIL] Value mismatch: expected {test_value}, got {read_value}"
-            )
-            all_passed = False
-            failed_values.append(test_value)
-            continue
-
-        test_utils.print_func(f"[PASSED] Verified humidity value {test_value}")
-
-    # Reset humidity to initial value
-    test_utils.print_func(f"\nResetting humidity to initial value {initial_value}...")
+    # Snapshot device memory once; only the humidity reading changes below
     device_memory = DeviceMemory()
-    if device.get_memory(device_memory):
-        device_memory.sensor_b_reading = initial_value
-        device.set_memory(device_memory)
-
-    # Small delay to ensure memory update is processed
-    time.sleep(0.1)
-
-    # Verify reset value
-    final_value = get_humidity_value_direct(driver)
-    if final_value is None:
-        test_utils.print_func("[FAIL] Failed to get final humidity value")
-        return False
-
-    test_utils.print_func(f"Final humidity value after reset: {final_value}")
-
-    if final_value != initial_value:
-        test_utils.print_func(
-            f"[FAIL] Failed to reset humidity value: expected {initial_value}, got {final_value}"
-        )
-        all_passed = False
-
-    if all_passed:
-        test_utils.print_func(
-            f"[PASSED] Humidity sensor test passed for all {len(test_values)} values"
-        )
-    else:
-        test_utils.print_func(
-            f"[FAIL] Humidity sensor test failed for values: {failed_values}"
-        )
-
-    return all_passed
-
-
-def test_humidity_get_api(driver, device):
-    """Test the get_humidity API function."""
-    test_utils.print_func("\n=== Testing Humidity Get API ===")
-
-    # Test a smaller set of values to keep the test manageable
-    test_values = [0, 25, 50, 75, 100, 125, 150, 175, 200, 225, 255]
-    all_passed = True
-    failed_values = []
-
-    # Get initial humidity value
-    initial_value = driver.get_humidity()
-    if initial_value is None:
-        test_utils.print_func("[FAIL] Failed to get initial humidity value")
+    if not device.get_memory(device_memory):
+        test_utils.print_func("[FAIL] Failed to get device memory")
         return False
 
-    test_utils.print_func(f"Initial humidity value: {initial_value}")
-    test_utils.print_func(f"Testing {len(test_values)} humidity values...")
-
     for test_value in test_values:
-        test_utils.print_func(f"\nSetting humidity value to {test_value}...")
-
-        # Get current device memory
-        device_memory = DeviceMemory()
-        if not device.get_memory(device_memory):
-            test_utils.print_func("[FAIL] Failed to get device memory")
-            all_passed = False
-            failed_values.append(test_value)
-            continue
+        if test_utils.VERBOSE:
+            test_utils.print_func(f"\nSetting humidity value to {test_value}...")
 
         # Update memory with new humidity value
         device_memory.sensor_b_reading = test_value
         if not device.set_memory(device_memory):
             test_utils.print_func("[FAIL] Failed to set device memory")
             all_passed = False
-            failed_values.append(test_value)
+            direct_failed_values.append(test_value)
+            api_failed_values.append(test_value)
             continue
 
-        # Small delay to ensure memory update is processed
-        time.sleep(0.1)
+        value_passed = True
+        for method, read_func, failed_values in readers:
+            # Poll until the memory update is visible rather than sleeping a
+            # fixed delay
+            read_value = test_utils.wait_for_value(read_func, test_value)
+            if read_value is None:
+                test_utils.print_func(
+                    f"[FAIL] Failed to read humidity value via {method}"
+                )
+            elif read_value != test_value:
+                test_utils.print_func(
+                    f"[FAIL] Value mismatch via {method}: expected {test_value}, got {read_value}"
+                )
+            else:
+                if test_utils.VERBOSE:
+                    test_utils.print_func(
+                        f"Read humidity value via {method}: {read_value}"
+                    )
+                continue
 
-        # Verify the value using the get_humidity API
-        read_value = driver.get_humidity()
-        if read_value is None:
-            test_utils.print_func("[FAIL] Failed to read humidity value")
             all_passed = False
+            value_passed = False
             failed_values.append(test_value)
-            continue
 
-        test_utils.print_func(f"Read humidity value: {read_value}")
-
-        # Check if the read value matches what we set
-        if read_value != test_value:
-            test_utils.print_func(
-                f"[FAIL] Value mismatch: expected {test_value}, got {read_value}"
-            )
-            all_passed = False
-            failed_values.append(test_value)
-            continue
-
-        test_utils.print_func(f"[PASSED] Verified humidity value {test_value}")
+        if test_utils.VERBOSE and value_passed:
+            test_utils.print_func(f"[PASSED] Verified humidity value {test_value}")
 
     # Reset humidity to initial value
     test_utils.print_func(f"\nResetting humidity to initial value {initial_value}...")
-    device_memory = DeviceMemory()
-    if device.get_memory(device_memory):
-        device_memory.sensor_b_reading = initial_value
-        device.set_memory(device_memory)
-
-    # Small delay to ensure memory update is processed
-    time.sleep(0.1)
-
-    # Verify reset value
-    final_value = driver.get_humidity()
-    if final_value is None:
-        test_utils.print_func("[FAIL] Failed to get final humidity value")
-        return False
+    device_memory.sensor_b_reading = initial_value
+    device.set_memory(device_memory)
 
-    test_utils.print_func(f"Final humidity value after reset: {final_value}")
+    # Verify reset value through both read paths
+    for method, read_func, _ in readers:
+        final_value = test_utils.wait_for_value(read_func, initial_value)
+        if final_value is None:
+            test_utils.print_func(
+                f"[FAIL] Failed to get final humidity value via {method}"
+            )
+            return False
 
-    if final_value != initial_value:
         test_utils.print_func(
-            f"[FAIL] Failed to reset humidity value: expected {initial_value}, got {final_value}"
+            f"Final humidity value via {method} after reset: {final_value}"
         )
-        all_passed = False
+
+        if final_value != initial_value:
+            test_utils.print_func(
+                f"[FAIL] Failed to reset humidity value: expected {initial_value}, got {final_value}"
+            )
+            all_passed = False
 
     if all_passed:
         test_utils.print_func(
-            f"[PASSED] Humidity get API test passed for all {len(test_values)} values"
+            f"[PASSED] Humidity sensor test passed for all {len(test_values)} values"
         )
     else:
         test_utils.print_func(
-            f"[FAIL] Humidity get API test failed for values: {failed_values}"
+            f"[FAIL] Humidity sensor test failed for values: "
+            f"direct command {direct_failed_values}, get_humidity API {api_failed_values}"
         )
 
     return all_passed
@@ -241,26 +152,11 @@ def run_tests(driver, device=None):
     # When running as part of the test suite, disable print
     test_utils.set_print_disabled()
 
-    results = []
-
-    # Run humidity sensor direct test
-    results.append(
-        ("Humidity Sensor Direct", test_humidity_sensor_direct(driver, device))
+    return test_utils.run_test_cases(
+        "Humidity Sensor Tests",
+        (("Humidity Sensor", lambda: test_humidity_sensor(driver, device)),),
     )
 
-    # Run humidity get API test
-    results.append(("Humidity Get API", test_humidity_get_api(driver, device)))
-
-    # Print summary
-    test_utils.print_func("\n=== Humidity Sensor Tests Summary ===")
-    all_passed = True
-    for name, result in results:
-        status = "[PASSED] PASSED" if result else "[FAIL] FAILED"
-        test_utils.print_func(f"{name}: {status}")
-        all_passed = all_passed and result
-
-    return all_passed
-
 
 def main():
     """Run the test in standalone mode."""
@@ -275,11 +171,7 @@ def main():
         # Run the tests
         test_utils.print_func("\n=== Running Humidity Sensor Tests ===")
 
-        # Run both tests
-        direct_test_result = test_humidity_sensor_direct(driver, device)
-        api_test_result = test_humidity_get_api(driver, device)
-
-        success = direct_test_result and api_test_result
+        success = test_humidity_sensor(driver, device)
 
         # Print overall result
         if success:
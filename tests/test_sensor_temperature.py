@@ -4,65 +4,71 @@ Test cases for temperature sensor functionality.
 """
 
 import sys
-import os
 
-# Add the python directory to the path
-sys.path.append(
-    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "python")
-)
-from driver import SensorData
-from device import DeviceMemory
 import test_utils
+from device import DeviceMemory
+
+# Every value of the 8-bit temperature reading
+TEMPERATURE_RANGE = range(256)
+# Spot checks for the get API, roughly every 25 steps plus the maximum
+API_TEST_VALUES = (0, 25, 50, 75, 100, 125, 150, 175, 200, 225, 255)
 
 
 def test_temperature_sensor_range(driver, device):
-    """Test temperature sensor across the full range (0-255)."""
-    test_utils.print_func("\n=== Testing Temperature Sensor Range (Brute Force) ===")
+    """Test temperature sensor across the range (0-255)."""
+    print_func = test_utils.print_func
+    print_func("\n=== Testing Temperature Sensor Range ===")
 
     # Get initial temperature value
     initial_value = driver.get_temperature()
     if initial_value is None:
-        test_utils.print_func("[FAIL] Failed to get initial temperature value")
+        print_func("[FAIL] Failed to get initial temperature value")
         return False
 
-    test_utils.print_func(f"Initial temperature value: {initial_value}")
+    print_func(f"Initial temperature value: {initial_value}")
 
-    # Test every value in the range 0-255
+    # Test every value in brute force mode, otherwise a covering subset
+    test_values = (
+        TEMPERATURE_RANGE if test_utils.BRUTE_FORCE else test_utils.COVERAGE_VALUES
+    )
     all_passed = True
     failed_values = []
 
-    test_utils.print_func("Testing all temperature values from 0 to 255...")
-    for test_value in range(256):
-        # Set temperature directly in the device
-        test_utils.print_func(f"Setting temperature value to {test_value}...")
+    # Snapshot device memory once; only the temperature reading changes below
+    device_memory = DeviceMemory()
+    if not device.get_memory(device_memory):
+        print_func("[FAIL] Failed to get device memory")
+        return False
 
-        # Get current device memory
-        device_memory = DeviceMemory()
-        if not device.get_memory(device_memory):
-            test_utils.print_func("[FAIL] Failed to get device memory")
-            all_passed = False
-            failed_values.append(test_value)
-            continue
+    print_func(f"Testing {len(test_values)} temperature values...")
+    # Bind the calls made for every value once, outside the loop
+    get_temperature = driver.get_temperature
+    set_memory = device.set_memory
+    for tested, test_value in enumerate(test_values, 1):
+        # Set temperature directly in the device
+        if test_utils.VERBOSE:
+            print_func(f"Setting temperature value to {test_value}...")
 
         # Update memory
         device_memory.sensor_a_reading = test_value
-        if not device.set_memory(device_memory):
-            test_utils.print_func("[FAIL] Failed to set device memory")
+        if not set_memory(device_memory):
+            print_func("[FAIL] Failed to set device memory")
             all_passed = False
             failed_values.append(test_value)
             continue
 
         # Verify the value through the driver
-        read_value = driver.get_temperature()
+        read_value = get_temperature()
         if read_value is None:
-            test_utils.print_func("[FAIL] Failed to get updated temperature value")
+            print_func("[FAIL] Failed to get updated temperature value")
             all_passed = False
             failed_values.append(test_value)
             continue
 
-        test_utils.print_func(f"Driver reports temperature value: {read_value}")
+        if test_utils.VERBOSE:
+            print_func(f"Driver reports temperature value: {read_value}")
         if read_value != test_value:
-            test_utils.print_func(
+            print_func(
                 f"[FAIL] Temperature value mismatch: expected {test_value}, got {read_value}"
             )
             all_passed = False
@@ -70,22 +76,22 @@ def test_temperature_sensor_range(driver, device):
             continue
 
         # Print progress every 25 values
-        if test_value % 25 == 0 or test_value == 255:
-            test_utils.print_func(f"[PASSED] Tested temperature values 0-{test_value}")
+        if test_utils.VERBOSE and (tested % 25 == 0 or tested == len(test_values)):
+            print_func(
+                f"[PASSED] Tested {tested} of {len(test_values)} temperature values"
+            )
 
     # Reset temperature to initial value
-    test_utils.print_func(f"Resetting temperature to initial value {initial_value}...")
-    device_memory = DeviceMemory()
-    if device.get_memory(device_memory):
-        device_memory.sensor_a_reading = initial_value
-        device.set_memory(device_memory)
+    print_func(f"Resetting temperature to initial value {initial_value}...")
+    device_memory.sensor_a_reading = initial_value
+    device.set_memory(device_memory)
 
     if all_passed:
-        test_utils.print_func(
-            "[PASSED] Temperature sensor range test passed for all 256 values"
+        print_func(
+            f"[PASSED] Temperature sensor range test passed for all {len(test_values)} values"
         )
     else:
-        test_utils.print_func(
+        print_func(
             f"[FAIL] Temperature sensor range test failed for values: {failed_values}"
         )
 
@@ -94,91 +100,93 @@ def test_temperature_sensor_range(driver, device):
 
 def test_temperature_get_api(driver, device):
     """Test the get_temperature API function."""
-    test_utils.print_func("\n=== Testing Temperature Get API ===")
+    print_func = test_utils.print_func
+    print_func("\n=== Testing Temperature Get API ===")
 
     # Test a smaller set of values to keep the test manageable
-    test_values = [0, 25, 50, 75, 100, 125, 150, 175, 200, 225, 255]
+    test_values = API_TEST_VALUES
     all_passed = True
     failed_values = []
 
     # Get initial temperature value
     initial_value = driver.get_temperature()
     if initial_value is None:
-        test_utils.print_func("[FAIL] Failed to get initial temperature value")
+        print_func("[FAIL] Failed to get initial temperature value")
         return False
 
-    test_utils.print_func(f"Initial temperature value: {initial_value}")
-    test_utils.print_func(f"Testing {len(test_values)} temperature values...")
+    print_func(f"Initial temperature value: {initial_value}")
 
-    for test_value in test_values:
-        test_utils.print_func(f"\nSetting temperature value to {test_value}...")
+    # Snapshot device memory once; only the temperature reading changes below
+    device_memory = DeviceMemory()
+    if not device.get_memory(device_memory):
+        print_func("[FAIL] Failed to get device memory")
+        return False
 
-        # Get current device memory
-        device_memory = DeviceMemory()
-        if not device.get_memory(device_memory):
-            test_utils.print_func("[FAIL] Failed to get device memory")
-            all_passed = False
-            failed_values.append(test_value)
-            continue
+    print_func(f"Testing {len(test_values)} temperature values...")
+
+    # Bind the calls made for every value once, outside the loop
+    get_temperature = driver.get_temperature
+    set_memory = device.set_memory
+    for test_value in test_values:
+        if test_utils.VERBOSE:
+            print_func(f"\nSetting temperature value to {test_value}...")
 
         # Update memory with new temperature value
         device_memory.sensor_a_reading = test_value
-        if not device.set_memory(device_memory):
-            test_utils.print_func("[FAIL] Failed to set device memory")
+        if not set_memory(device_memory):
+            print_func("[FAIL] Failed to set device memory")
             all_passed = False
             failed_values.append(test_value)
             continue
 
         # Verify the value using the get_temperature API
-        read_value = driver.get_temperature()
+        read_value = get_temperature()
         if read_value is None:
-            test_utils.print_func("[FAIL] Failed to read temperature value")
+            print_func("[FAIL] Failed to read temperature value")
             all_passed = False
             failed_values.append(test_value)
             continue
 
-        test_utils.print_func(f"Read temperature value: {read_value}")
+        if test_utils.VERBOSE:
+            print_func(f"Read temperature value: {read_value}")
 
         # Check if the read value matches what we set
         if read_value != test_value:
-            test_utils.print_func(
+            print_func(
                 f"[FAIL] Value mismatch: expected {test_value}, got {read_value}"
             )
             all_passed = False
             failed_values.append(test_value)
             continue
 
-        test_utils.print_func(f"[PASSED] Verified temperature value {test_value}")
+        if test_utils.VERBOSE:
+            print_func(f"[PASSED] Verified temperature value {test_value}")
 
     # Reset temperature to initial value
-    test_utils.print_func(
-        f"\nResetting temperature to initial value {initial_value}..."
-    )
-    device_memory = DeviceMemory()
-    if device.get_memory(device_memory):
-        device_memory.sensor_a_reading = initial_value
-        device.set_memory(device_memory)
+    print_func(f"\nResetting temperature to initial value {initial_value}...")
+    device_memory.sensor_a_reading = initial_value
+    device.set_memory(device_memory)
 
     # Verify reset value
     final_value = driver.get_temperature()
     if final_value is None:
-        test_utils.print_func("[FAIL] Failed to get final temperature value")
+        print_func("[FAIL] Failed to get final temperature value")
         return False
 
-    test_utils.print_func(f"Final temperature value after reset: {final_value}")
+    print_func(f"Final temperature value after reset: {final_value}")
 
     if final_value != initial_value:
-        test_utils.print_func(
+        print_func(
             f"[FAIL] Failed to reset temperature value: expected {initial_value}, got {final_value}"
         )
         all_passed = False
 
     if all_passed:
-        test_utils.print_func(
+        print_func(
             f"[PASSED] Temperature get API test passed for all {len(test_values)} values"
         )
     else:
-        test_utils.print_func(
+        print_func(
             f"[FAIL] Temperature get API test failed for values: {failed_values}"
         )
 
@@ -190,26 +198,17 @@ def run_tests(driver, device):
     # When running as part of the test suite, disable print
     test_utils.set_print_disabled()
 
-    results = []
-
-    # Run temperature sensor range test (comprehensive)
-    results.append(
-        ("Temperature Sensor Range", test_temperature_sensor_range(driver, device))
+    return test_utils.run_test_cases(
+        "Temperature Sensor Tests",
+        (
+            (
+                "Temperature Sensor Range",
+                lambda: test_temperature_sensor_range(driver, device),
+            ),
+            ("Temperature Get API", lambda: test_temperature_get_api(driver, device)),
+        ),
     )
 
-    # Run temperature get API test
-    results.append(("Temperature Get API", test_temperature_get_api(driver, device)))
-
-    # Print summary
-    test_utils.print_func("\n=== Temperature Sensor Tests Summary ===")
-    all_passed = True
-    for name, result in results:
-        status = "[PASSED] PASSED" if result else "[FAIL] FAILED"
-        test_utils.print_func(f"{name}: {status}")
-        all_passed = all_passed and result
-
-    return all_passed
-
 
 def main():
     """Run the test in standalone mode."""
@@ -5,15 +5,10 @@ Copy this file and modify it for your specific test needs.
 """
 
 import sys
-import os
 
-# Add the python directory to the path
-sys.path.append(
-    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "python")
-)
+import test_utils
 from driver import DeviceStatus, SensorData, ActuatorData
 from device import DeviceMemory
-import test_utils
 
 
 def test_example(driver):
@@ -54,23 +49,15 @@ def run_tests(driver):
     # When running as part of the test suite, disable print
     test_utils.set_print_disabled()
 
-    results = []
-
-    # Add your tests here
-    results.append(("Example Test", test_example(driver)))
-
-    # Add more tests as needed
-    # results.append(("Another Test", test_another(driver)))
-
-    # Print summary
-    test_utils.print_func("\n=== Test Summary ===")
-    all_passed = True
-    for name, result in results:
-        status = "[PASSED] PASSED" if result else "[FAIL] FAILED"
-        test_utils.print_func(f"{name}: {status}")
-        all_passed = all_passed and result
-
-    return all_passed
+    return test_utils.run_test_cases(
+        "Test",
+        (
+            # Add your tests here
+            ("Example Test", lambda: test_example(driver)),
+            # Add more tests as needed
+            # ("Another Test", lambda: test_another(driver)),
+        ),
+    )
 
 
 def main():
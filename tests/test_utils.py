@@ -4,25 +4,60 @@ Utility functions for test cases.
 This module provides common functionality for loading, initializing, and cleaning up DLLs.
 """
 
-import ctypes
 import sys
 import os
+import errno
+import random
 import time
 import socket
+import selectors
 import traceback
 
-# Add the python directory to the path
-sys.path.append(
-    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "python")
-)
+# Repository root and the paths derived from it, resolved once at import
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PYTHON_DIR = os.path.join(BASE_DIR, "python")
+DLL_DIR = os.path.join(BASE_DIR, "build", "bin", "Debug")
+DEVICE_DLL_PATH = os.path.join(DLL_DIR, "semi_vibe_device.dll")
+DRIVER_DLL_PATH = os.path.join(DLL_DIR, "semi_vibe_driver.dll")
+
+# Add the python directory to the path once; test modules import this
+# module before the driver so they share this setup
+if PYTHON_DIR not in sys.path:
+    sys.path.append(PYTHON_DIR)
 from driver import DriverDLL
 from device import DeviceDLL
 
 
 # Use real print for standalone execution, disabled print for test runner
 print_func = print
+# Whether print_func produces output, lets hot loops skip building messages
+# and error handlers skip formatting tracebacks
+VERBOSE = True
+# Sweep every value of the 8-bit registers instead of COVERAGE_VALUES
+# (SEMIVIBE_BRUTE=1, or --brute when running run_tests.py)
+BRUTE_FORCE = os.environ.get("SEMIVIBE_BRUTE", "") not in ("", "0")
+# Boundaries, every single bit, alternating bit patterns and a few fixed
+# pseudo-random values; exercises every bit of an 8-bit register
+COVERAGE_VALUES = tuple(
+    sorted(
+        {0, 1, 2, 4, 8, 16, 32, 64, 128, 255, 0x55, 0xAA}
+        | set(random.Random(0).sample(range(256), 4))
+    )
+)
+# connect_ex results meaning a non-blocking connect is still in progress
+CONNECT_IN_PROGRESS = frozenset(
+    code
+    for code in (
+        errno.EINPROGRESS,
+        errno.EWOULDBLOCK,
+        getattr(errno, "WSAEWOULDBLOCK", None),
+    )
+    if code is not None
+)
+# Stop a module's remaining tests after its first failure (SEMIVIBE_FAIL_FAST=1)
+FAIL_FAST = os.environ.get("SEMIVIBE_FAIL_FAST", "") not in ("", "0")
 # Flag to control whether callbacks should print messages
-enable_callback_prints = True
+_callback_prints_enabled = True
 
 
 def print_disabled(string):
@@ -32,227 +67,237 @@ def print_disabled(string):
 
 def set_print_disabled():
     """Set the print function to disabled."""
-    global print_func
+    global print_func, VERBOSE
     print_func = print_disabled
+    VERBOSE = False
 
 
-def disable_callback_prints():
-    """Disable printing from callbacks."""
-    global enable_callback_prints
-    enable_callback_prints = False
-
+def set_callback_prints(enabled):
+    """Enable or disable printing from callbacks.
 
-def enable_callback_prints():
-    """Enable printing from callbacks."""
-    global enable_callback_prints
-    enable_callback_prints = True
+    Args:
+        enabled: True to print messages received by the log callbacks
+    """
+    global _callback_prints_enabled
+    _callback_prints_enabled = enabled
 
 
 def device_log_callback(message):
     """Callback function for device logging."""
-    if enable_callback_prints:
+    if _callback_prints_enabled:
         print_func(f"Device: {message.decode('utf-8')}")
 
 
 def driver_log_callback(message):
     """Callback function for driver logging."""
-    if enable_callback_prints:
+    if _callback_prints_enabled:
         print_func(f"Driver: {message.decode('utf-8')}")
 
 
-def is_server_ready(host="localhost", port=8989, max_attempts=10):
-    """Check if the server is ready to accept connections."""
-    print_func(f"Checking if server is ready on {host}:{port}...")
+def try_connect(selector, host, port, timeout):
+    """Attempt one non-blocking connect to the server.
 
-    for attempt in range(max_attempts):
+    Args:
+        selector: Selector used to wait for the connect to complete
+        host: Server host name
+        port: Server port
+        timeout: Maximum time to wait for the connection in seconds
+
+    Returns:
+        bool: True if the connection was established
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.setblocking(False)
+        err = s.connect_ex((host, port))
+        if err == 0:
+            return True
+        if err not in CONNECT_IN_PROGRESS:
+            # Failed immediately, e.g. refused or unreachable
+            return False
+
+        # The connect is in progress; the socket becomes writable once it
+        # completes and SO_ERROR then tells success from failure
+        selector.register(s, selectors.EVENT_WRITE)
         try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.settimeout(1)
-                s.connect((host, port))
-                print_func(f"Server is ready after {attempt + 1} attempts!")
+            if not selector.select(timeout):
+                return False
+        finally:
+            selector.unregister(s)
+        return s.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
+
+
+def is_server_ready(host="localhost", port=8989, max_wait=10.0):
+    """Check if the server is ready to accept connections.
+
+    Retries with exponential backoff, starting at 5 ms and capped at
+    200 ms, so a server that starts quickly is detected within milliseconds.
+
+    Args:
+        host: Server host name
+        port: Server port
+        max_wait: Maximum total time to wait in seconds
+
+    Returns:
+        bool: True if the server accepted a connection
+    """
+    print_func(f"Checking if server is ready on {host}:{port}...")
+
+    deadline = time.perf_counter() + max_wait
+    delay = 0.005
+    attempt = 0
+    # A refused socket cannot be reconnected, but one selector serves
+    # every attempt
+    with selectors.DefaultSelector() as selector:
+        while True:
+            attempt += 1
+            remaining = deadline - time.perf_counter()
+            if try_connect(selector, host, port, max(remaining, 0)):
+                print_func(f"Server is ready after {attempt} attempts!")
                 return True
-        except (ConnectionRefusedError, socket.timeout):
-            print_func(
-                f"Server not ready yet (attempt {attempt + 1}/{max_attempts})..."
-            )
-            time.sleep(1)
 
-    print_func(f"Server did not become ready after {max_attempts} attempts")
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            print_func(f"Server not ready yet (attempt {attempt})...")
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 0.2)
+
+    print_func(f"Server did not become ready within {max_wait} seconds")
     return False
 
 
+def call_wrapper(target, name, method, args, ok_message, action):
+    """Call a DLL wrapper method with error handling.
+
+    Args:
+        target: DeviceDLL or DriverDLL instance, None if it failed to load
+        name: "Device" or "Driver", used in the not loaded message
+        method: Name of the wrapper method to call
+        args: Tuple of arguments to pass to the method
+        ok_message: Printed after [OK] when the call succeeds
+        action: Describes the call in error messages, e.g. "starting device server"
+
+    Returns:
+        bool: True if the call succeeded
+    """
+    if not target:
+        print_func(f"ERROR: {name} DLL not loaded")
+        return False
+
+    try:
+        result = getattr(target, method)(*args)
+        if result:
+            print_func(f"[OK] {ok_message}")
+            return True
+        else:
+            print_func(f"ERROR {action}")
+            return False
+    except Exception as e:
+        print_func(f"ERROR {action}: {str(e)}")
+        if VERBOSE:
+            traceback.print_exc()
+        return False
+
+
 def load_device_dll(device_dll_path=None):
     """Load the device DLL with error handling."""
     if device_dll_path is None:
-        # Get the path to the DLL
-        device_dll_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-            "build",
-            "bin",
-            "Debug",
-            "semi_vibe_device.dll",
-        )
+        device_dll_path = DEVICE_DLL_PATH
 
     try:
         # Load the device DLL
         device = DeviceDLL(device_dll_path)
-        device.set_log_callback(device_log_callback)
         print_func("[OK] Device DLL loaded successfully")
         return device
     except Exception as e:
         print_func(f"ERROR loading device DLL: {str(e)}")
-        traceback.print_exc()
+        if VERBOSE:
+            traceback.print_exc()
         return None
 
 
 def initialize_device(device):
     """Initialize the device with error handling."""
-    if not device:
-        print_func("ERROR: Device DLL not loaded")
-        return False
-
-    try:
-        # Initialize the device
-        result = device.initialize()
-        if result:
-            print_func("[OK] Device initialized successfully")
-            return True
-        else:
-            print_func("ERROR initializing device")
-            return False
-    except Exception as e:
-        print_func(f"ERROR initializing device: {str(e)}")
-        traceback.print_exc()
-        return False
+    return call_wrapper(
+        device,
+        "Device",
+        "init",
+        (device_log_callback,),
+        "Device initialized successfully",
+        "initializing device",
+    )
 
 
 def start_device(device):
     """Start the device server with error handling."""
-    if not device:
-        print_func("ERROR: Device DLL not loaded")
-        return False
-
-    try:
-        # Start the device server
-        result = device.start_server()
-        if result:
-            print_func("[OK] Device server started successfully")
-            return True
-        else:
-            print_func("ERROR starting device server")
-            return False
-    except Exception as e:
-        print_func(f"ERROR starting device server: {str(e)}")
-        traceback.print_exc()
-        return False
+    return call_wrapper(
+        device,
+        "Device",
+        "start",
+        (),
+        "Device server started successfully",
+        "starting device server",
+    )
 
 
 def stop_device(device):
     """Stop the device server with error handling."""
-    if not device:
-        print_func("ERROR: Device DLL not loaded")
-        return False
-
-    try:
-        # Stop the device server
-        result = device.stop_server()
-        if result:
-            print_func("[OK] Device server stopped")
-            return True
-        else:
-            print_func("ERROR stopping device server")
-            return False
-    except Exception as e:
-        print_func(f"ERROR stopping device server: {str(e)}")
-        traceback.print_exc()
-        return False
+    return call_wrapper(
+        device, "Device", "stop", (), "Device server stopped", "stopping device server"
+    )
 
 
 def load_driver_dll(driver_dll_path=None):
     """Load the driver DLL with error handling."""
     if driver_dll_path is None:
-        # Get the path to the DLL
-        driver_dll_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-            "build",
-            "bin",
-            "Debug",
-            "semi_vibe_driver.dll",
-        )
+        driver_dll_path = DRIVER_DLL_PATH
 
     try:
         # Load the driver DLL
         driver = DriverDLL(driver_dll_path)
-        driver.set_log_callback(driver_log_callback)
         print_func("[OK] Driver DLL loaded successfully")
         return driver
     except Exception as e:
         print_func(f"ERROR loading driver DLL: {str(e)}")
-        traceback.print_exc()
+        if VERBOSE:
+            traceback.print_exc()
         return None
 
 
 def initialize_driver(driver):
     """Initialize the driver with error handling."""
-    if not driver:
-        print_func("ERROR: Driver DLL not loaded")
-        return False
-
-    try:
-        # Initialize the driver
-        result = driver.initialize()
-        if result:
-            print_func("[OK] Driver initialized successfully")
-            return True
-        else:
-            print_func("ERROR initializing driver")
-            return False
-    except Exception as e:
-        print_func(f"ERROR initializing driver: {str(e)}")
-        traceback.print_exc()
-        return False
+    return call_wrapper(
+        driver,
+        "Driver",
+        "init",
+        (driver_log_callback,),
+        "Driver initialized successfully",
+        "initializing driver",
+    )
 
 
 def connect_driver(driver, host="localhost", port=8989):
     """Connect the driver to the device with error handling."""
-    if not driver:
-        print_func("ERROR: Driver DLL not loaded")
-        return False
-
-    try:
-        # Connect the driver to the device
-        result = driver.connect(host, port)
-        if result:
-            print_func("[OK] Connected to device successfully")
-            return True
-        else:
-            print_func("ERROR connecting to device")
-            return False
-    except Exception as e:
-        print_func(f"ERROR connecting to device: {str(e)}")
-        traceback.print_exc()
-        return False
+    return call_wrapper(
+        driver,
+        "Driver",
+        "connect",
+        (host, port),
+        "Connected to device successfully",
+        "connecting to device",
+    )
 
 
 def disconnect_driver(driver):
     """Disconnect the driver from the device with error handling."""
-    if not driver:
-        print_func("ERROR: Driver DLL not loaded")
-        return False
-
-    try:
-        # Disconnect the driver from the device
-        result = driver.disconnect()
-        if result:
-            print_func("[OK] Driver disconnected")
-            return True
-        else:
-            print_func("ERROR disconnecting driver")
-            return False
-    except Exception as e:
-        print_func(f"ERROR disconnecting driver: {str(e)}")
-        traceback.print_exc()
-        return False
+    return call_wrapper(
+        driver,
+        "Driver",
+        "disconnect",
+        (),
+        "Driver disconnected",
+        "disconnecting driver",
+    )
 
 
 def setup_test_environment():
@@ -310,6 +355,58 @@ def teardown_test_environment(device, driver):
         stop_device(device)
 
 
+def wait_for_value(read_func, expected, timeout=0.1, interval=0.001):
+    """Poll a read function until it returns the expected value.
+
+    A failed read (None) ends the wait at once; retrying a broken read path
+    only repeats its failure until the timeout.
+
+    Args:
+        read_func: Function taking no arguments that returns the current
+            value, or None if the read failed
+        expected: Value to wait for
+        timeout: Maximum time to wait in seconds
+        interval: Delay between reads in seconds
+
+    Returns:
+        The last value read: expected, None if a read failed, or another
+        value if the timeout expired
+    """
+    deadline = time.perf_counter() + timeout
+    value = read_func()
+    while value is not None and value != expected and time.perf_counter() < deadline:
+        time.sleep(interval)
+        value = read_func()
+    return value
+
+
+def run_test_cases(title, cases):
+    """Run a module's test cases in order and print a summary.
+
+    Args:
+        title: Summary heading, e.g. "LED Tests"
+        cases: Iterable of (name, test) pairs where test takes no arguments
+            and returns True if it passed
+
+    Returns:
+        bool: True if every test that ran passed
+    """
+    results = []
+    for name, test in cases:
+        result = test()
+        results.append((name, result))
+        if FAIL_FAST and not result:
+            break
+
+    # Print summary
+    print_func(f"\n=== {title} Summary ===")
+    for name, result in results:
+        status = "[PASSED] PASSED" if result else "[FAIL] FAILED"
+        print_func(f"{name}: {status}")
+
+    return all(result for _, result in results)
+
+
 def run_standalone_test(test_func):
     """Run a test function in standalone mode.
 
@@ -320,7 +417,7 @@ def run_standalone_test(test_func):
         int: 0 if successful, 1 if failed
     """
     # Enable callback prints for standalone tests
-    enable_callback_prints()
+    set_callback_prints(True)
 
     device, driver = setup_test_environment()
     if not device or not driver: